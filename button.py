@@ -26,6 +26,9 @@ class ButtonBehavior:
   def on_release(self) -> Optional[ButtonEvent]:
     return None
 
+  def is_active(self) -> bool:
+    return False
+
 
 class HoldDownBehavior(ButtonBehavior):
   def __init__(self, initial_delay: int, repeat_interval: int):
@@ -53,6 +56,9 @@ class HoldDownBehavior(ButtonBehavior):
     self._is_held_down = False
     return ButtonEvent.RELEASE
 
+  def is_active(self) -> bool:
+    return self._is_held_down
+
 
 class SingleClickBehavior(ButtonBehavior):
   def __init__(self):
@@ -68,6 +74,9 @@ class SingleClickBehavior(ButtonBehavior):
       if self._cooldown == 0:
         return ButtonEvent.RELEASE
 
+  def is_active(self) -> bool:
+    return self._cooldown > 0
+
 
 class Button(Component):
   def __init__(self, size: Tuple[int, int], label: StaticText, behavior: ButtonBehavior,
@@ -78,9 +87,13 @@ class Button(Component):
     self._style_on_click: Style = kwargs.get('style_onclick')
     self._hotkey = hotkey
     self._behavior = behavior
+    self._text_offset = None
+    self._styles_fill_background = _fills_background(self._style_hovered) and _fills_background(self._style_on_click)
 
-  def update(self, elapsed_time: int):
-    self._handle_event(self._behavior.update(elapsed_time))
+  def update(self, elapsed_time: int) -> bool:
+    event = self._behavior.update(elapsed_time)
+    self._handle_event(event)
+    return event is not None or self._behavior.is_active()
 
   def set_callback(self, callback: Callable[[], Any]):
     self._callback = callback
@@ -89,13 +102,29 @@ class Button(Component):
     super().set_pos(pos)
     self._update_text_pos()
 
+  def set_size(self, size: Tuple[int, int]):
+    super().set_size(size)
+    self._text_offset = None
+    self._update_text_pos()
+
   def _update_text_pos(self):
-    text_pos = Vector2(self._rect.centerx - self._label.size[0] / 2,
-                       self._rect.centery - self._label.size[1] / 2)
-    self._label.set_pos(text_pos)
+    # The label offset only depends on the button and label sizes, so repositioning reuses it
+    if self._text_offset is None:
+      (label_w, label_h) = self._label.size
+      self._text_offset = ((self.size[0] - label_w) // 2, (self.size[1] - label_h) // 2)
+    self._label.set_pos((self._rect.x + self._text_offset[0], self._rect.y + self._text_offset[1]))
+    fits_static_background = self._styles_fill_background and self._label_fits()
+    if fits_static_background != self._fits_static_background:
+      self._fits_static_background = fits_static_background
+      self._notify_parent()
+
+  def _label_fits(self) -> bool:
+    border_width = self._style.border_width if self._style and self._style.border_color else 0
+    return self._rect.inflate(-2 * border_width, -2 * border_width).contains(self._label._rect)
 
   def set_label(self, label: str):
     self._label.set_text(label)
+    self._text_offset = None
     self._update_text_pos()
 
   def set_label_color(self, color: Color):
@@ -127,6 +156,10 @@ class Button(Component):
       self._active_style = self._style_hovered if self._is_hovered else self._style
 
 
+def _fills_background(style: Optional[Style]) -> bool:
+  return style is not None and (style.background_color is not None or style.background_surface is not None)
+
+
 class ColorToggler(Button):
   def __init__(self, size: Tuple[int, int], label: StaticText, colors: List[Color], **kwargs):
     super().__init__(size, label, **kwargs)
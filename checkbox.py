@@ -22,19 +22,21 @@ class Checkbox(Component):
     self._checked = checked
     self._box = None
 
-  def update(self, elapsed_time: int):
+  def update(self, elapsed_time: int) -> bool:
     if self._cooldown > 0:
       self._cooldown = max(self._cooldown - elapsed_time, 0)
       if self._cooldown == 0:
         self._active_style = self._style_hovered if self._is_hovered else self._style
+      return True
+    return False
 
   def set_callback(self, callback: Callable[[bool], Any]):
     self._callback = callback
 
   def set_pos(self, pos: Vector2):
     super().set_pos(pos)
-    text_pos = Vector2(self._rect.centerx - self._label.size[0] / 2,
-                       self._rect.centery - self._label.size[1] / 2)
+    text_pos = (self._rect.centerx - self._label.size[0] // 2,
+                self._rect.centery - self._label.size[1] // 2)
     self._label.set_pos(text_pos)
     w = self._label._rect.h * 0.75
     self._box = Rect(self._label._rect.right + 10, self._label._rect.bottom - w - 1, w, w)
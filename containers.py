@@ -14,6 +14,30 @@ class AbstractContainer(Component):
   def __init__(self, size: Tuple[int, int], children: List[Component], **kwargs):
     super().__init__(size, **kwargs)
     self._children = children
+    for component in children:
+      component._parent = self
+    # Only children that reported ongoing updates are updated every frame. Input can start new cooldowns or timers
+    # anywhere, so all children are updated again after each input event that reaches this container.
+    self._pending_updates: List[Component] = list(children)
+    self._bounds = None
+    self._pointer_in_bounds = False
+
+  def set_pos(self, pos: Vector2):
+    super().set_pos(pos)
+    self._bounds = None
+
+  # Children may stick out of their container, e.g. a grid that is wider than the EvenSpacingContainer around it
+  def _hover_bounds(self) -> Rect:
+    if self._bounds is None:
+      self._bounds = self._rect.unionall([component._hover_bounds() for component in self._children])
+    return self._bounds
+
+  # Called when a child was moved, resized or shown / hidden
+  def _on_child_changed(self):
+    # Ancestors only cache bounds that were computed from this container's bounds, so propagation can stop here
+    if self._bounds is not None:
+      self._bounds = None
+      self._notify_parent()
 
   def _render_contents(self, surface):
     for component in self._children:
@@ -23,20 +47,40 @@ class AbstractContainer(Component):
     for component in self._children:
       component.handle_mouse_was_clicked(mouse_pos)
 
-  def update(self, elapsed_time: int):
-    for component in self._children:
-      component.update(elapsed_time)
+  def update(self, elapsed_time: int) -> bool:
+    still_pending = []
+    for component in self._pending_updates:
+      if component.update(elapsed_time):
+        still_pending.append(component)
+    self._pending_updates = still_pending
+    return len(still_pending) > 0
+
+  def _schedule_updates(self):
+    self._pending_updates = list(self._children)
+
+  def handle_mouse_was_clicked(self, mouse_pos: Tuple[int, int]):
+    self._schedule_updates()
+    super().handle_mouse_was_clicked(mouse_pos)
 
   def handle_mouse_motion(self, mouse_pos: Tuple[int, int]):
     super().handle_mouse_motion(mouse_pos)
+    # Children can only be (or have just stopped being) hovered if the pointer is or was within their bounds
+    pointer_in_bounds = self._hover_bounds().collidepoint(mouse_pos[0], mouse_pos[1])
+    if self._pointer_in_bounds or pointer_in_bounds:
+      self._handle_children_mouse_motion(mouse_pos)
+    self._pointer_in_bounds = pointer_in_bounds
+
+  def _handle_children_mouse_motion(self, mouse_pos: Tuple[int, int]):
     for component in self._children:
       component.handle_mouse_motion(mouse_pos)
 
   def handle_key_was_pressed(self, key):
+    self._schedule_updates()
     for component in self._children:
       component.handle_key_was_pressed(key)
 
   def handle_key_was_released(self, key):
+    self._schedule_updates()
     for component in self._children:
       component.handle_key_was_released(key)
 
@@ -45,6 +89,7 @@ class AbstractContainer(Component):
       component._on_blur()
 
   def handle_mouse_was_released(self):
+    self._schedule_updates()
     for component in self._children:
       component.handle_mouse_was_released()
 
@@ -58,7 +103,7 @@ class AbsolutePosContainer(AbstractContainer):
   def set_pos(self, pos: Vector2):
     super().set_pos(pos)
     for relative_pos, component in self._positioned_children:
-      component.set_pos(pos + relative_pos)
+      component.set_pos((pos[0] + relative_pos[0], pos[1] + relative_pos[1]))
 
 
 class Orientation(Enum):
@@ -117,13 +162,13 @@ class ListContainer(AbstractContainer):
 
   def set_pos(self, pos: Vector2):
     super().set_pos(pos)
-    relative_pos = Vector2(self._padding, self._padding)
+    relative_pos = (self._padding, self._padding)
     for component in self._children:
-      component.set_pos(pos + relative_pos)
+      component.set_pos((pos[0] + relative_pos[0], pos[1] + relative_pos[1]))
       if self._orientation == Orientation.HORIZONTAL:
-        relative_pos += (component.size[0] + self._margin, 0)
+        relative_pos = (relative_pos[0] + component.size[0] + self._margin, relative_pos[1])
       else:
-        relative_pos += (0, component.size[1] + self._margin)
+        relative_pos = (relative_pos[0], relative_pos[1] + component.size[1] + self._margin)
 
 
 class EvenSpacingContainer(AbstractContainer):
@@ -140,13 +185,13 @@ class EvenSpacingContainer(AbstractContainer):
     width_sum = sum([component.size[0] for component in self._children])
     if len(self._children) < 2:
       component = self._children[0]
-      component.set_pos(Vector2(self._rect.centerx - component.size[0] // 2, pos[1] + self._padding))
+      component.set_pos((self._rect.centerx - component.size[0] // 2, pos[1] + self._padding))
       return
     margin = (self.size[0] - width_sum - self._padding * 2) / (len(self._children) - 1)
-    relative_pos = Vector2(self._padding, self._padding)
+    relative_pos = (self._padding, self._padding)
     for component in self._children:
-      component.set_pos(pos + relative_pos)
-      relative_pos += (component.size[0] + margin, 0)
+      component.set_pos((pos[0] + relative_pos[0], pos[1] + relative_pos[1]))
+      relative_pos = (relative_pos[0] + component.size[0] + margin, relative_pos[1])
 
 
 # NOTE: Scroll container sets "local" positions for its children, in contrast to other containers
@@ -204,8 +249,11 @@ class ScrollContainer(AbstractContainer):
     self._scrollbar_bottom = Rect(self._scrollbar.x, self._scrollbar.y + self._scrollbar.h // 2, self._scrollbar.w,
                                   self._scrollbar.h // 2)
 
-  def handle_mouse_motion(self, mouse_pos: Tuple[int, int]):
-    super().handle_mouse_motion(mouse_pos)
+  # Children are positioned locally and clipped to this container
+  def _hover_bounds(self) -> Rect:
+    return self._rect
+
+  def _handle_children_mouse_motion(self, mouse_pos: Tuple[int, int]):
     local_mouse_pos = (mouse_pos[0] - self._rect.x, mouse_pos[1] - self._rect.y)
     for component in self._children:
       component.handle_mouse_motion(local_mouse_pos)
@@ -225,14 +273,15 @@ class ScrollContainer(AbstractContainer):
     self._scrolling_velocity = 0
 
   def _update_children(self):
-    pos = Vector2(self._padding, self._padding - self._scroll_y)
+    y = self._padding - self._scroll_y
     for component in self._children:
-      component.set_pos(pos)
-      pos += (0, component.size[1] + self._margin)
+      component.set_pos((self._padding, y))
+      y += component.size[1] + self._margin
 
-  def update(self, elapsed_time: int):
-    super().update(elapsed_time)
+  def update(self, elapsed_time: int) -> bool:
+    is_active = super().update(elapsed_time)
     self.scroll(self._scrolling_velocity)
+    return is_active or self._scrolling_velocity != 0
 
 
 class GridContainer(AbstractContainer):
@@ -244,14 +293,71 @@ class GridContainer(AbstractContainer):
     self._dimensions = dimensions
     self._padding = padding
     self._margin = margin
+    self._hovered_index = None
+    self._child_rects = []
+    self._static_layer = None
+    self._static_layer_is_current = False
 
   def set_pos(self, pos: Vector2):
     super().set_pos(pos)
     relative_pos = (self._padding, self._padding)
     num_cols = self._dimensions[0]
     for i, component in enumerate(self._children):
-      component.set_pos(pos + relative_pos)
+      component.set_pos((pos[0] + relative_pos[0], pos[1] + relative_pos[1]))
       if i % num_cols == num_cols - 1:
         relative_pos = (self._padding, relative_pos[1] + self._cell_size[1] + self._margin)
       else:
         relative_pos = (relative_pos[0] + self._cell_size[0] + self._margin, relative_pos[1])
+    self._child_rects = [component._rect for component in self._children]
+
+  def _on_child_changed(self):
+    super()._on_child_changed()
+    self._static_layer_is_current = False
+
+  # Backgrounds and borders of idle children are cached in one layer, only hovered or clicked children are drawn in
+  # full on top of it. This only matches drawing child by child while no child draws outside its own cell, otherwise
+  # the children are drawn one by one.
+  def _render_contents(self, surface):
+    if not self._static_layer_is_current:
+      self._static_layer = self._render_static_layer()
+      self._static_layer_is_current = True
+    if self._static_layer is None:
+      super()._render_contents(surface)
+      return
+    surface.blit(self._static_layer, self._rect)
+    for component in self._children:
+      if component._active_style is not component._style:
+        component.render(surface)
+      elif component._is_visible:
+        component._render_contents(surface)
+
+  def _render_static_layer(self) -> Optional[Surface]:
+    visible_children = [component for component in self._children if component._is_visible]
+    if not all(component._fits_static_background for component in visible_children):
+      return None
+    layer = Surface(self.size, pygame.SRCALPHA)
+    for component in visible_children:
+      if component._style:
+        (background_color, background_surface, border_color, border_width) = component._style._render_plan
+        rect = component._rect.move(-self._rect.x, -self._rect.y)
+        if background_color:
+          pygame.draw.rect(layer, background_color, rect)
+        elif background_surface:
+          layer.blit(background_surface, rect)
+        if border_color:
+          pygame.draw.rect(layer, border_color, rect, border_width)
+    return layer
+
+  def _handle_children_mouse_motion(self, mouse_pos: Tuple[int, int]):
+    # Only the child under the pointer and the previously hovered one can change hover state
+    index = self._child_index_at(mouse_pos)
+    if self._hovered_index is not None and self._hovered_index != index:
+      self._children[self._hovered_index].handle_mouse_motion(mouse_pos)
+    if index is not None:
+      self._children[index].handle_mouse_motion(mouse_pos)
+    self._hovered_index = index
+
+  def _child_index_at(self, mouse_pos: Tuple[int, int]) -> Optional[int]:
+    # Cells don't overlap, so the first hit is the only one
+    index = Rect(mouse_pos, (1, 1)).collidelist(self._child_rects)
+    return index if index >= 0 else None
@@ -34,6 +34,6 @@ class Counter(Component):
     self._text.format_text(self._count)
 
   def _update_text_pos(self):
-    text_pos = Vector2(self._rect.centerx - self._text.size[0] / 2,
-                       self._rect.centery - self._text.size[1] / 2)
+    text_pos = (self._rect.centerx - self._text.size[0] // 2,
+                self._rect.centery - self._text.size[1] // 2)
     self._text.set_pos(text_pos)
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import os
+from functools import partial
 from typing import Tuple, Callable, Any, Optional
 
 import pygame
@@ -26,6 +27,11 @@ COLOR_DIR = Color(50, 50, 150)
 SCREEN_RESOLUTION = (800, 600)
 BUTTON_SIZE = (256, 24)
 PADDING = 32
+FPS = 60
+
+# Expose events have no handler, but they wake an idle loop and mark the frame dirty so an uncovered window is redrawn
+EVENT_TYPES = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+               pygame.MOUSEMOTION, pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE]
 
 
 class FileBrowser:
@@ -34,6 +40,8 @@ class FileBrowser:
     pygame.init()
     screen = pygame.display.set_mode(SCREEN_RESOLUTION)
     pygame.display.set_caption("FILE BROWSER")
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(EVENT_TYPES)
     clock = Clock()
 
     font = Font('resources/consola.ttf', 14)
@@ -51,7 +59,8 @@ class FileBrowser:
     dir_path = os.path.dirname(os.path.realpath(__file__))
     self.text_current_dir = StaticText(font, WHITE, dir_path,
                                        style=Style(background_color=Color(50, 50, 50)))
-    self.file_names = os.listdir(".")
+    self.entries = []
+    self._read_dir()
     self.preview = FilePreview((width, 230), font_small)
 
     container = AbsolutePosContainer(SCREEN_RESOLUTION,
@@ -60,101 +69,156 @@ class FileBrowser:
                                       (Vector2(PADDING, 330), grid_container)])
     container.set_pos(Vector2(0, 0))
 
+    # Button i + 1 always opens entry i of the current listing, so callbacks are bound once and only labels change
+    self.buttons[0].set_callback(lambda: self.change_dir(".."))
+    for i, btn in enumerate(self.buttons[1:]):
+      btn.set_callback(partial(self.open_entry, i))
     self.setup_keys()
 
-    while True:
-      for event in pygame.event.get():
-        handle_exit(event)
-        if event.type == pygame.MOUSEBUTTONDOWN:
-          container.handle_mouse_was_clicked(pygame.mouse.get_pos())
-        elif event.type == pygame.MOUSEBUTTONUP:
-          container.handle_mouse_was_released()
-        elif event.type == pygame.MOUSEMOTION:
-          container.handle_mouse_motion(pygame.mouse.get_pos())
-        elif event.type == pygame.KEYDOWN:
-          container.handle_key_was_pressed(event.key)
-        elif event.type == pygame.KEYUP:
-          container.handle_key_was_released(event.key)
-      elapsed_time = clock.tick()
-
-      container.update(elapsed_time)
-
+    mouse_moved = False
+
+    # Only the latest pointer position matters for hover state, so consecutive motion events are handled once. Any
+    # other input flushes pending motion first, so e.g. a click style isn't overwritten by a late hover.
+    def handle_mouse_motion(event):
+      nonlocal mouse_moved
+      mouse_moved = True
+
+    def flush_mouse_motion():
+      nonlocal mouse_moved
+      if mouse_moved:
+        mouse_moved = False
+        container.handle_mouse_motion(pygame.mouse.get_pos())
+
+    def after_mouse_motion(handler):
+      def flushing_handler(event):
+        flush_mouse_motion()
+        handler(event)
+      return flushing_handler
+
+    handlers = {
+      pygame.QUIT: handle_exit,
+      pygame.MOUSEBUTTONDOWN: after_mouse_motion(
+          lambda event: container.handle_mouse_was_clicked(pygame.mouse.get_pos())),
+      pygame.MOUSEBUTTONUP: after_mouse_motion(lambda event: container.handle_mouse_was_released()),
+      pygame.MOUSEMOTION: handle_mouse_motion,
+      pygame.KEYDOWN: after_mouse_motion(lambda event: handle_key_down(container, event)),
+      pygame.KEYUP: after_mouse_motion(lambda event: container.handle_key_was_released(event.key)),
+    }
+
+    def render_frame():
       screen.fill(background_color)
       container.render(screen)
       pygame.display.flip()
 
+    # The first frame has to be drawn even if no input arrives
+    render_frame()
+    dirty = True
+    while True:
+      # When the previous frame changed nothing, block until input arrives instead of polling. The waited event is
+      # dispatched directly so idle frames allocate no event list.
+      has_waited = not dirty
+      if has_waited:
+        event = pygame.event.wait()
+        handlers.get(event.type, _noop)(event)
+        # Time spent waiting must not advance cooldowns and timers
+        clock.tick()
+      dirty = has_waited
+      # Peeking is a single check, so frames without queued input skip building an empty event list
+      if pygame.event.peek(EVENT_TYPES):
+        for event in pygame.event.get(EVENT_TYPES):
+          handlers.get(event.type, _noop)(event)
+          dirty = True
+
+      flush_mouse_motion()
+      # The clock was just reset after waiting, so capping this frame would only delay the response to the input
+      elapsed_time = clock.tick() if has_waited else clock.tick(FPS)
+
+      if container.update(elapsed_time):
+        dirty = True
+
+      # Frames without input or running updates would be identical to the previous one
+      if dirty:
+        render_frame()
+
   def change_dir(self, directory: str):
     os.chdir(directory)
-    self.file_names = os.listdir(".")
+    self._read_dir()
     self.text_current_dir.set_text(os.getcwd())
     self.setup_keys()
 
-  def create_file_callback(self, filename: str):
-    def callback():
-      if os.path.isdir(filename):
-        self.change_dir(filename)
-      else:
+  def _read_dir(self):
+    # Directory entries carry their file type, so classifying them needs no extra stat call per file
+    with os.scandir(".") as entries:
+      self.entries = sorted(entries, key=lambda entry: entry.name)
+
+  def open_entry(self, index: int):
+    if index >= len(self.entries):
+      return
+    entry = self.entries[index]
+    filename = entry.name
+    if entry.is_dir():
+      self.change_dir(filename)
+    else:
+      try:
+        with open(filename, "r") as f:
+          text = f.read()
+          self.preview.show_text("Text file: %s\n\n%s" % (filename, text))
+      except UnicodeDecodeError:
         try:
-          with open(filename, "r") as f:
-            text = f.read()
-            self.preview.show_text("Text file: %s\n\n%s" % (filename, text))
-        except UnicodeDecodeError:
+          image = pygame.image.load(filename)
+          self.preview.show_image(image)
+        except pygame.error:
           try:
-            image = pygame.image.load(filename)
-            self.preview.show_image(image)
+            self.preview.play_sound(filename)
           except pygame.error:
-            try:
-              self.preview.play_sound(filename)
-            except pygame.error:
-              self.preview.show_text("Unknown file: %s\n\ncontents not shown" % filename)
-
-    return callback
+            self.preview.show_text("Unknown file: %s\n\ncontents not shown" % filename)
 
   def setup_keys(self):
     self.buttons[0].set_label("..")
-    self.buttons[0].set_callback(lambda: self.change_dir(".."))
     for i, btn in enumerate(self.buttons[1:]):
-      if i < len(self.file_names):
-        filename = self.file_names[i]
-        btn.set_label(filename)
-        btn.set_callback(self.create_file_callback(filename))
-        btn.set_label_color(Color(150, 150, 255) if os.path.isdir(filename) else WHITE)
+      if i < len(self.entries):
+        entry = self.entries[i]
+        btn.set_label(entry.name)
+        btn.set_label_color(Color(150, 150, 255) if entry.is_dir() else WHITE)
       else:
         btn.set_label("")
-        btn.set_callback(lambda: None)
 
 
 class FilePreview(Component):
   def __init__(self, size: Tuple[int, int], font):
     super().__init__(size)
-    self._text_component = TextArea(font, WHITE, size, padding=16,
-                                    style=Style(border_color=LIGHT_GRAY))
-    self._image_component = Surface(None, style=Style(border_color=LIGHT_GRAY))
+    self._font = font
+    # Most clicks only navigate directories, so the text and image components are created on first use
+    self._text_component: Optional[TextArea] = None
+    self._image_component = None
     self._seekbar = Seekbar((size[0] - 8, 16))
     self._seekbar.set_visible(False)
 
-  def update(self, elapsed_time: int):
-    self._seekbar.update(elapsed_time)
+  def update(self, elapsed_time: int) -> bool:
+    return self._seekbar.update(elapsed_time)
 
   def set_pos(self, pos: Vector2):
     super().set_pos(pos)
-    self._text_component.set_pos(pos)
-    self._image_component.set_pos(pos)
-    self._seekbar.set_pos(Vector2(self._rect.x + 4, self._rect.bottom - 20))
+    if self._text_component:
+      self._text_component.set_pos(pos)
+    if self._image_component:
+      self._image_component.set_pos(pos)
+    self._seekbar.set_pos((self._rect.x + 4, self._rect.bottom - 20))
 
   def show_text(self, text: str):
-    self._text_component.set_text(text)
-    self._text_component.set_visible(True)
-    self._image_component.set_visible(False)
+    self._show_text(text)
     self._seekbar.set_visible(False)
 
   def show_image(self, image):
+    if self._image_component is None:
+      self._image_component = Surface(None, style=Style(border_color=LIGHT_GRAY))
     scaled_size = image.get_rect().fit(self._rect).size
     scaled_image = pygame.transform.scale(image, scaled_size)
-    self._image_component.set_pos(Vector2(self._rect.centerx - scaled_size[0] // 2, self._rect.y))
+    self._image_component.set_pos((self._rect.centerx - scaled_size[0] // 2, self._rect.y))
 
     self._image_component.set_surface(scaled_image)
-    self._text_component.set_visible(False)
+    if self._text_component:
+      self._text_component.set_visible(False)
     self._image_component.set_visible(True)
     self._seekbar.set_visible(False)
 
@@ -162,16 +226,29 @@ class FilePreview(Component):
     sound = pygame.mixer.Sound(filename)
     duration = sound.get_length()
     text = "Sound file: %s\n\nDuration: %.3f seconds" % (filename, duration)
-    self._text_component.set_text(text)
-    self._text_component.set_visible(True)
-    self._image_component.set_visible(False)
+    self._show_text(text)
     self._seekbar.set_visible(True)
     self._seekbar.start(int(duration * 1000))
     sound.play()
 
+  def _show_text(self, text: str):
+    if self._text_component is None:
+      self._text_component = TextArea(self._font, WHITE, self.size, padding=16,
+                                      style=Style(border_color=LIGHT_GRAY))
+      self._text_component.set_pos(self._rect.topleft)
+    self._text_component.set_text(text)
+    self._text_component.set_visible(True)
+    if self._image_component:
+      self._image_component.set_visible(False)
+
   def _render_contents(self, surface):
-    self._text_component.render(surface)
-    self._image_component.render(surface)
+    if self._text_component:
+      self._text_component.render(surface)
+    if self._image_component:
+      self._image_component.render(surface)
+    if self._text_component is None and self._image_component is None:
+      # Same outline the empty text area would draw
+      pygame.draw.rect(surface, LIGHT_GRAY, self._rect, 1)
     self._seekbar.render(surface)
 
 
@@ -187,9 +264,11 @@ class Seekbar(Component):
     self._total_millis = total_millis
     self._remaining_millis = total_millis
 
-  def update(self, elapsed_time: int):
+  def update(self, elapsed_time: int) -> bool:
+    is_playing = self._remaining_millis > 0
     self._remaining_millis = max(self._remaining_millis - elapsed_time, 0)
     self._update_inner_rect()
+    return is_playing
 
   def set_pos(self, pos: Vector2):
     super().set_pos(pos)
@@ -212,6 +291,15 @@ def handle_exit(event):
     exit(0)
 
 
+def handle_key_down(container: Component, event):
+  handle_exit(event)
+  container.handle_key_was_pressed(event.key)
+
+
+def _noop(event):
+  pass
+
+
 def button(font, size: Tuple[int, int], callback: Callable[[], Any], label: str, background_color: Color,
     hotkey: Optional[int] = None,
     hold: Optional[HoldDownBehavior] = None):
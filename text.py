@@ -1,28 +1,41 @@
+from functools import lru_cache
 from typing import Tuple, Any, Optional
 
+import pygame
 from pygame.color import Color
 from pygame.font import Font
 from pygame.math import Vector2
+from pygame.surface import Surface
 
 from ui import Component
 
 
+# Labels like "..", "" or repeated file names are measured and rasterized once and shared between text components
+@lru_cache(maxsize=512)
+def _render_text(font: Font, color: Tuple[int, int, int, int], text: str) -> Tuple[Surface, Tuple[int, int]]:
+  rendered_text = font.render(text, True, color)
+  # Matching the display's pixel format lets every later blit skip the per-pixel format conversion
+  if pygame.display.get_surface() is not None:
+    rendered_text = rendered_text.convert_alpha()
+  return rendered_text, font.size(text)
+
+
 class StaticText(Component):
   def __init__(self, font: Font, color: Color, text: str, **kwargs):
-    super().__init__(font.size(text), **kwargs)
+    rendered_text, text_size = _render_text(font, tuple(color), text)
+    super().__init__(text_size, **kwargs)
     self._font = font
     self._color = color
     self._text = text
-    self._rendered_text = None
-    self._update_text()
+    self._rendered_text = rendered_text
 
   def _update_text(self):
-    self._rendered_text = self._font.render(self._text, True, self._color)
+    self._rendered_text, _ = _render_text(self._font, tuple(self._color), self._text)
 
   def set_text(self, text: str):
-    self.set_size(self._font.size(text))
     self._text = text
-    self._update_text()
+    self._rendered_text, text_size = _render_text(self._font, tuple(self._color), text)
+    self.set_size(text_size)
 
   def _render_contents(self, surface):
     surface.blit(self._rendered_text, self._rect)
@@ -35,17 +48,16 @@ class StaticText(Component):
 class FormattedText(Component):
   def __init__(self, font: Font, color: Color, format_string: str, format_variable: Any, **kwargs):
     text = format_string % format_variable
-    text_size = font.size(text)
+    rendered_text, text_size = _render_text(font, tuple(color), text)
     super().__init__(text_size, **kwargs)
     self._format_string = format_string
     self._font = font
     self._color = color
-    self._rendered_text = self._font.render(text, True, color)
+    self._rendered_text = rendered_text
 
   def format_text(self, variable: Any):
     text = self._format_string % variable
-    self.size = self._font.size(text)
-    self._rendered_text = self._font.render(text, True, self._color)
+    self._rendered_text, self.size = _render_text(self._font, tuple(self._color), text)
 
   def _render_contents(self, surface):
     surface.blit(self._rendered_text, self._rect)
@@ -64,7 +76,7 @@ class EditableText(Component):
 
   def set_pos(self, pos: Vector2):
     super().set_pos(pos)
-    text_pos = pos + Vector2(self._padding, self._padding)
+    text_pos = (pos[0] + self._padding, pos[1] + self._padding)
     self._text.set_pos(text_pos)
 
   def append(self, text: str):
@@ -109,9 +121,12 @@ class TextArea(Component):
     super().set_pos(pos)
     self._render_text()
 
-  def update(self, elapsed_time: int):
-    if self._blinking_cursor and self._blinking_cursor.update(elapsed_time):
-      self._render_text()
+  def update(self, elapsed_time: int) -> bool:
+    if self._blinking_cursor:
+      if self._blinking_cursor.update(elapsed_time):
+        self._render_text()
+      return True
+    return False
 
   def _render_text(self):
     self._line_surfaces = []
@@ -160,7 +175,7 @@ class TextArea(Component):
     return self._font.render(line, True, self._color)
 
   def _render_contents(self, surface):
-    (x, y) = self._rect.topleft + Vector2(self._padding, self._padding)
+    (x, y) = (self._rect.x + self._padding, self._rect.y + self._padding)
     for line_surface in self._line_surfaces:
       surface.blit(line_surface, (x, y))
       y += line_surface.get_size()[1]
@@ -11,12 +11,16 @@ class BackgroundGrid:
     self._screen_resolution = screen_resolution
     self._line_color = line_color
     self._cell_width = cell_width
-
-  def render(self, surface):
+    # The grid never changes, so its lines are drawn once and blitted every frame
+    surface = pygame.Surface(screen_resolution, pygame.SRCALPHA)
     for x in range(0, self._screen_resolution[0], self._cell_width):
       pygame.draw.line(surface, self._line_color, (x, 0), (x, self._screen_resolution[1]))
     for y in range(0, self._screen_resolution[1], self._cell_width):
       pygame.draw.line(surface, self._line_color, (0, y), (self._screen_resolution[0], y))
+    self._surface = surface.convert_alpha()
+
+  def render(self, surface):
+    surface.blit(self._surface, (0, 0))
 
 
 class Style:
@@ -25,10 +29,36 @@ class Style:
       background_surface: Optional[Any] = None,
       border_color: Optional[Color] = None,
       border_width: int = 1):
-    self.background_color = background_color
-    self.background_surface = background_surface
-    self.border_color = border_color
-    self.border_width = border_width
+    # Unpacked in one step by Component.render instead of looking up each attribute every frame. Colors are stored as
+    # RGBA tuples, which pygame's draw functions take without going through the Color type check.
+    self._render_plan = (_rgba(background_color), background_surface, _rgba(border_color), border_width)
+
+  @property
+  def background_color(self) -> Optional[Color]:
+    return _color(self._render_plan[0])
+
+  @property
+  def background_surface(self) -> Optional[Any]:
+    return self._render_plan[1]
+
+  @property
+  def border_color(self) -> Optional[Color]:
+    return _color(self._render_plan[2])
+
+  @property
+  def border_width(self) -> int:
+    return self._render_plan[3]
+
+
+def _rgba(color: Optional[Color]) -> Optional[Tuple[int, ...]]:
+  return tuple(color) if color is not None else None
+
+
+def _color(rgba: Optional[Tuple[int, ...]]) -> Optional[Color]:
+  return Color(*rgba) if rgba is not None else None
+
+
+_NO_STYLE_RENDER_PLAN = (None, None, None, 0)
 
 
 # TODO Handle padding in component?
@@ -41,17 +71,29 @@ class Component:
     self._is_hovered = False
     self._active_style: Style = self._style
     self._is_visible = True
+    # Set by the container that holds this component
+    self._parent = None
+    # True if everything _render_contents draws stays inside the idle border, and every other style this component
+    # switches to paints its whole background. The idle background and border can then be drawn ahead of time.
+    self._fits_static_background = False
 
-  def update(self, elapsed_time: int):
-    pass
+  # Returns True if time-based state changed or is still in progress, i.e. the component wants more updates
+  def update(self, elapsed_time: int) -> bool:
+    return False
 
   def set_pos(self, pos: Vector2):
     self._rect = Rect(pos, self.size)
+    self._notify_parent()
+
+  # Area in which the pointer can hover this component or anything inside it
+  def _hover_bounds(self) -> Rect:
+    return self._rect
 
   # TODO Have stricter control over size variable - make it private and always set it with this method?
   def set_size(self, size: Tuple[int, int]):
     self.size = size
     self._rect.size = size
+    self._notify_parent()
 
   def handle_key_was_pressed(self, key):
     pass
@@ -82,17 +124,21 @@ class Component:
   def render(self, surface):
     self._assert_initialized()
     if self._is_visible:
-      if self._active_style:
-        if self._active_style.background_color:
-          pygame.draw.rect(surface, self._active_style.background_color, self._rect)
-        elif self._active_style.background_surface:
-          surface.blit(self._active_style.background_surface, self._rect)
+      style = self._active_style
+      (background_color, background_surface, border_color, border_width) = \
+        style._render_plan if style else _NO_STYLE_RENDER_PLAN
+      rect = self._rect
+      if background_color:
+        pygame.draw.rect(surface, background_color, rect)
+      elif background_surface:
+        surface.blit(background_surface, rect)
       self._render_contents(surface)
-      if self._active_style and self._active_style.border_color:
-        pygame.draw.rect(surface, self._active_style.border_color, self._rect, self._active_style.border_width)
+      if border_color:
+        pygame.draw.rect(surface, border_color, rect, border_width)
 
   def set_visible(self, visible: bool):
     self._is_visible = visible
+    self._notify_parent()
 
   def is_visible(self) -> bool:
     return self._is_visible
@@ -111,6 +157,10 @@ class Component:
   def _on_blur(self):
     pass
 
+  def _notify_parent(self):
+    if self._parent:
+      self._parent._on_child_changed()
+
   def _assert_initialized(self):
     if self._rect is None:
       raise Exception("You must set the position of this component before interacting with it: %s" % self)